@@ -26,11 +26,15 @@ import pandas as pd
 from pathlib import Path
 from howlongtobeatpy import HowLongToBeat, SearchModifiers
 import sys
+import os
+import io
+import contextlib
 import json
+import time
+import warnings
 import argparse
 import aiohttp
-import tkinter as tk
-from tkinter import ttk, messagebox
+from functools import lru_cache
 
 # Try to import keyring, fall back to file-based storage if unavailable
 try:
@@ -41,15 +45,93 @@ except ImportError:
     print("Note: 'keyring' not installed. Credentials will be stored in a local file.")
     print("      Install keyring for secure storage: pip install keyring")
 
+# Try to import orjson for faster cache files, fall back to the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import rapidfuzz for faster HLTB match scoring, fall back to pure Python
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Try to import xlsxwriter for faster Excel output, fall back to openpyxl
+try:
+    import xlsxwriter  # noqa: F401 (used by pandas' Excel writer)
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Try to import pyexcelerate for the fastest Excel output
+try:
+    from pyexcelerate import Workbook
+    PYEXCELERATE_AVAILABLE = True
+except ImportError:
+    PYEXCELERATE_AVAILABLE = False
+
+# Try to import pyarrow for fast Parquet checkpoints, fall back to Excel
+try:
+    import pyarrow  # noqa: F401 (used by pandas' Parquet support)
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
 # Constants
-DELAY_BETWEEN_REQUESTS = 0.3  # Reduced since we're limiting concurrency
+HLTB_REQUESTS_PER_SECOND = 10 # Average HLTB search rate (token bucket)
+RA_REQUESTS_PER_SECOND = 10   # Average RA API request rate (token bucket)
 MAX_CONCURRENT_REQUESTS = 5   # Number of simultaneous HLTB lookups
+RA_CONCURRENT_REQUESTS = 20   # Number of simultaneous RA progression lookups
+RA_PAGE_CONCURRENCY = 5       # Number of Want to Play list pages fetched at once
+REQUEST_TIMEOUT = 30          # Seconds before an RA request is abandoned
+CONNECT_TIMEOUT = 10          # Seconds allowed to establish a connection
+ADMISSION_RECOVERY = 20       # Successful requests before a lowered limit is raised again
+PROGRESS_FLUSH_EVERY = 20     # Write the progress file after this many new results...
+PROGRESS_FLUSH_INTERVAL = 2.0 # ...or after this many seconds, whichever comes first
+CONSOLE_FLUSH_INTERVAL = 0.1  # Seconds between terminal writes while processing
+CHECKPOINT_EVERY = 25         # Save the sheet after this many completed lookups...
+EXCEL_CHECKPOINT_EVERY = 200  # ...or this many when checkpoints have to be written as Excel
 RA_API_BASE = "https://retroachievements.org/API"
-PROGRESS_FILE = 'hltb_progress.json'
+PROGRESS_FILE = 'hltb_progress.jsonl'
+LEGACY_PROGRESS_FILE = 'hltb_progress.json'  # Whole-file format used by older versions
 RA_CACHE_FILE = 'ra_wanttoplay_cache.json'
+RA_CACHE_META_FILE = 'ra_wanttoplay_cache.meta.json'  # Username/count/fetch time of RA_CACHE_FILE
+RA_CACHE_TTL = 3600           # Seconds an update scan reuses the cached Want to Play list
 CREDS_FILE = '.ra_credentials.json'  # Fallback if keyring unavailable
 KEYRING_SERVICE = 'RAHLTBScraper'
 
+# RA Want to Play fields and the DataFrame columns they map to
+RA_GAME_FIELDS = {
+    'Title': 'Title',
+    'ConsoleName': 'System',
+    'AchievementsPublished': 'Achievements',
+    'PointsTotal': 'Points',
+    'ID': 'RA_ID',
+}
+
+# Columns filled in by HLTB/RA lookups, empty for newly listed games
+EMPTY_DATA_COLUMNS = [
+    'HLTB_Beat', 'HLTB_Complete',
+    'RA_Beat', 'RA_Master', 'RA_Players',
+    'Points_Per_Hour', 'Comments',
+]
+
+# Progress cache fields and the DataFrame columns they fill
+PROGRESS_COLUMNS = {
+    'beat': 'HLTB_Beat',
+    'complete': 'HLTB_Complete',
+    'ra_beat_time': 'RA_Beat',
+    'ra_master_time': 'RA_Master',
+    'distinct_players': 'RA_Players',
+    'comment': 'Comments',
+}
+
+# Fields of a progress entry that come from the HLTB search
+HLTB_RESULT_FIELDS = ('beat', 'complete', 'hltb_name', 'similarity', 'error', 'comment')
+
 # ANSI color codes for terminal output
 class Colors:
     RED = '\033[91m'
@@ -60,6 +142,48 @@ class Colors:
 # Regex patterns for title normalization
 import re
 
+# All bracket/paren/tag strippers fused into one alternation so each title is
+# scanned once:
+# - ~Tag~ prefixes (Hack, Homebrew, Prototype, Demo, Unlicensed, Translation, etc.)
+# - [Subset - ...] markers and other bracket tags [!], [T+Eng], [T-En], etc.
+# - Region codes (USA), (Europe), (Japan), (J), (U), (E), (En,Fr,De), (World), etc.
+# - Version/revision info (Rev 1), (Rev A), (v1.0), (V1.1), (Beta), (Proto), (Sample)
+# - (Disc 1), (Disc 2), etc.
+_STRIP_RE = re.compile(
+    r'^~[^~]+~\s*'
+    r'|\[[^\]]*\]'
+    r'|\((?:USA|Europe|Japan|World|En|Fr|De|Es|It|J|U|E|En,\s*[A-Za-z,\s]+)\)'
+    r'|\((?:Rev\s*[A-Z0-9]*|v[0-9]+\.[0-9]+|Beta|Proto|Sample|Virtual Console|PSN|XBLA)\)'
+    r'|\(Disc\s*[0-9]+\)',
+    re.IGNORECASE | re.ASCII  # Every token is ASCII, so skip Unicode case folding/classes
+)
+# Left Unicode-aware on purpose: titles can contain non-breaking or ideographic spaces
+_WS_RE = re.compile(r'\s+')
+
+# Special characters normalized for better matching, applied in one pass.
+# Pokemon uses é but HLTB might use e, Okami uses ō
+_DIACRITIC_TABLE = str.maketrans({
+    'é': 'e', 'É': 'E',
+    'ō': 'o', 'Ō': 'O',
+    'ü': 'u', 'Ü': 'U',
+})
+
+# Words that don't count as "extra" when comparing HLTB results to a search
+_COMMON_WORDS = frozenset({'the', 'a', 'an', 'of', 'and', '&', '-', 'edition', 'remastered', 'hd', 'definitive'})
+
+# Separators used to derive HLTB search variants: " | " between alternate
+# titles, and the first ":" or " - " marking a subtitle. Lookaheads keep
+# the matches zero-width so one scan finds every separator.
+_VARIANT_SEP_RE = re.compile(r'(?P<alt>(?= \| ))|(?P<colon>:)|(?P<dash>(?= - ))')
+
+# Numbered sequel detection (roman numerals or digits as a standalone word).
+# Titles are matched against ASCII numerals only, so skip Unicode classes.
+_SEQUEL_RE = re.compile(r'\b(?:II|III|IV|V|VI|VII|VIII|IX|X|[0-9]+)\b', re.IGNORECASE | re.ASCII)
+
+# Match-quality labels that search_game writes into the Comments column
+_MATCH_QUALITY_RE = re.compile(r'(fuzzy|loose|poor|no hltb) match', re.IGNORECASE)
+
+@lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
     """
     Aggressively normalize RA titles for better HLTB matching.
@@ -73,48 +197,325 @@ def normalize_title(title: str) -> str:
     - Articles for sorting: ", The" at end becomes "The " at start
     - Normalizes special characters (é -> e for Pokemon)
     """
-    clean = title
-    
-    # Remove ~Tag~ prefixes (Hack, Homebrew, Prototype, Demo, Unlicensed, Translation, etc.)
-    clean = re.sub(r'^~[^~]+~\s*', '', clean)
-    
-    # Remove [Subset - ...] markers
-    clean = re.sub(r'\[Subset\s*-\s*[^\]]+\]', '', clean)
-    
-    # Remove other bracket tags [!], [T+Eng], [T-En], etc.
-    clean = re.sub(r'\[[^\]]*\]', '', clean)
-    
-    # Remove region codes (USA), (Europe), (Japan), (J), (U), (E), (En,Fr,De), (World), etc.
-    clean = re.sub(r'\((?:USA|Europe|Japan|World|En|Fr|De|Es|It|J|U|E|En,\s*[A-Za-z,\s]+)\)', '', clean, flags=re.IGNORECASE)
-    
-    # Remove version/revision info (Rev 1), (Rev A), (v1.0), (V1.1), (Beta), (Proto), (Sample)
-    clean = re.sub(r'\((?:Rev\s*[A-Z0-9]*|v\d+\.\d+|Beta|Proto|Sample|Virtual Console|PSN|XBLA)\)', '', clean, flags=re.IGNORECASE)
-    
-    # Remove (Disc 1), (Disc 2), etc.
-    clean = re.sub(r'\(Disc\s*\d+\)', '', clean, flags=re.IGNORECASE)
+    # Strip tags, subsets, region/version/disc markers in a single pass
+    clean = _STRIP_RE.sub('', title)
     
     # Handle ", The" at end -> "The " at start (for alphabetized titles)
     if clean.endswith(', The'):
         clean = 'The ' + clean[:-5]
     
     # Normalize special characters for better matching
-    # Pokemon uses é but HLTB might use e
-    clean = clean.replace('é', 'e').replace('É', 'E')
-    clean = clean.replace('ō', 'o').replace('Ō', 'O')  # Okami uses ō
-    clean = clean.replace('ü', 'u').replace('Ü', 'U')
+    clean = clean.translate(_DIACRITIC_TABLE)
     
     # Remove double spaces and trim
-    clean = re.sub(r'\s+', ' ', clean).strip()
+    clean = _WS_RE.sub(' ', clean).strip()
     
     return clean
 
 
-async def fetch_game_progression(session: aiohttp.ClientSession, api_key: str, game_id: int) -> dict:
+def normalize_titles(titles: pd.Series) -> pd.Series:
+    """
+    Column-wise normalize_title for a whole Series of titles.
+    
+    Runs each step once over the column with pandas string methods instead
+    of calling normalize_title per title. Results are identical.
+    """
+    clean = titles.astype(str).str.replace(_STRIP_RE, '', regex=True)
+    
+    # Handle ", The" at end -> "The " at start
+    ends_with_the = clean.str.endswith(', The')
+    clean = clean.where(~ends_with_the, 'The ' + clean.str[:-5])
+    
+    clean = clean.str.translate(_DIACRITIC_TABLE)
+    return clean.str.replace(_WS_RE, ' ', regex=True).str.strip()
+
+
+class AdmissionController:
+    """
+    Concurrency limiter whose limit can be changed while tasks are waiting.
+    
+    Works like asyncio.Semaphore, but keeps an explicit in-flight counter
+    guarded by a Condition, so the limit can be lowered when a server pushes
+    back (HTTP 429/5xx) and raised again once requests succeed.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.max_limit = limit
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+    
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify(1)
+    
+    async def set_limit(self, limit: int):
+        """Change the limit and wake waiters that may now be admitted."""
+        async with self._cond:
+            self.limit = max(1, min(limit, self.max_limit))
+            self._successes = 0
+            self._cond.notify_all()
+    
+    async def backoff(self):
+        """Server is pushing back: admit one fewer request at a time."""
+        await self.set_limit(self.limit - 1)
+    
+    async def record_success(self):
+        """Raise a lowered limit by one after a run of successful requests."""
+        if self.limit >= self.max_limit:
+            return
+        self._successes += 1
+        if self._successes >= ADMISSION_RECOVERY:
+            await self.set_limit(self.limit + 1)
+
+
+class RateLimiter:
+    """
+    Token bucket bounding the request rate to one host.
+    
+    Tokens refill continuously at `rate` per second up to `max_tokens`, and
+    acquire() only sleeps when the bucket is empty, so requests go out as
+    soon as the average rate allows instead of after a fixed delay.
+    """
+    
+    def __init__(self, rate: float, max_tokens: int):
+        self.rate = rate
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+    
+    async def acquire(self):
+        """Take a token, waiting until it has refilled if the bucket is empty."""
+        now = time.monotonic()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        
+        # Take the token now, even if it's not there yet: a negative balance
+        # reserves future tokens, so callers are served in arrival order
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+# One bucket per host, shared by every request to it
+_hltb_limiter = RateLimiter(HLTB_REQUESTS_PER_SECOND, MAX_CONCURRENT_REQUESTS)
+_ra_limiter = RateLimiter(RA_REQUESTS_PER_SECOND, RA_CONCURRENT_REQUESTS)
+
+
+class ProgressWriter:
+    """
+    Background task that persists the progress cache as results arrive.
+    
+    Results are queued and appended to the JSONL progress file in a worker
+    thread at most every PROGRESS_FLUSH_EVERY results or
+    PROGRESS_FLUSH_INTERVAL seconds, so saving never blocks the lookups.
+    Only new entries are written; the file is never rewritten mid-scan.
+    """
+    
+    def __init__(self, progress: dict, path: Path):
+        self.progress = progress
+        self.path = path
+        self._queue = asyncio.Queue()
+        self._task = None
+        self._pending = []
+    
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+    
+    def put(self, cache_key: str, entry: dict):
+        """Queue a finished game's result for saving."""
+        self._queue.put_nowait((cache_key, entry))
+    
+    async def close(self):
+        """Flush anything pending and stop the writer."""
+        self._queue.put_nowait(None)
+        await self._task
+    
+    async def _run(self):
+        last_flush = time.monotonic()
+        done = False
+        while not done:
+            try:
+                item = await asyncio.wait_for(self._queue.get(), PROGRESS_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                item = ()  # Idle: flush whatever is pending
+            
+            if item is None:
+                done = True
+            elif item:
+                cache_key, entry = item
+                self.progress[cache_key] = entry
+                self._pending.append(item)
+                if (len(self._pending) < PROGRESS_FLUSH_EVERY and
+                        time.monotonic() - last_flush < PROGRESS_FLUSH_INTERVAL):
+                    continue
+            
+            if self._pending:
+                batch, self._pending = self._pending, []
+                await asyncio.to_thread(append_progress, self.path, batch)
+                last_flush = time.monotonic()
+
+
+class ConsoleWriter:
+    """
+    Background task that batches per-game terminal output.
+    
+    Lines are queued and written to stdout in one chunk every
+    CONSOLE_FLUSH_INTERVAL seconds instead of flushing on every print.
+    """
+    
+    def __init__(self):
+        self._queue = asyncio.Queue()
+        self._task = None
+    
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+    
+    def put(self, line: str):
+        """Queue a line for printing."""
+        self._queue.put_nowait(line + '\n')
+    
+    async def close(self):
+        """Print anything pending and stop the writer."""
+        self._queue.put_nowait(None)
+        await self._task
+    
+    async def _run(self):
+        buffer = []
+        last_flush = time.monotonic()
+        done = False
+        while not done:
+            try:
+                item = await asyncio.wait_for(self._queue.get(), CONSOLE_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                item = ''  # Idle: print whatever is pending
+            
+            if item is None:
+                done = True
+            elif item:
+                buffer.append(item)
+                if time.monotonic() - last_flush < CONSOLE_FLUSH_INTERVAL:
+                    continue
+            
+            if buffer:
+                sys.stdout.write(''.join(buffer))
+                sys.stdout.flush()
+                buffer.clear()
+            last_flush = time.monotonic()
+
+
+def dumps_json(data) -> bytes:
+    """Encode data as JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def loads_json(data: bytes):
+    """Decode JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path):
+    """Load a JSON cache file."""
+    return loads_json(Path(path).read_bytes())
+
+
+def write_json(path: Path, data):
+    """
+    Write a JSON cache file.
+    
+    The data is encoded in one go and written with a single write to a
+    temp file that then replaces the original, so an interrupted save never
+    leaves a truncated cache behind.
+    """
+    tmp_path = Path(f"{path}.tmp")
+    tmp_path.write_bytes(dumps_json(data))
+    os.replace(tmp_path, path)
+
+
+def _progress_lines(items) -> bytes:
+    """Encode (cache_key, entry) pairs as progress file lines."""
+    return b''.join(dumps_json({'key': cache_key, **entry}) + b'\n' for cache_key, entry in items)
+
+
+def append_progress(path: Path, items: list):
+    """Append (cache_key, entry) pairs to the JSONL progress file."""
+    with open(path, 'ab') as f:
+        f.write(_progress_lines(items))
+
+
+def load_progress(path: Path) -> dict:
+    """
+    Load the progress cache from the JSONL progress file.
+    
+    Each line is {"key": cache_key, **entry}; later lines win, and a line cut
+    short by an interrupted run is dropped. A progress file from older
+    versions (one JSON object) is merged in and migrated. The file is
+    compacted to one line per game whenever it holds duplicates.
+    """
+    progress = {}
+    legacy_path = Path(LEGACY_PROGRESS_FILE)
+    if legacy_path.exists():
+        progress.update(read_json(legacy_path))
+    
+    lines = 0
+    damaged = False
+    if path.exists():
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    entry = loads_json(line)
+                    progress[entry.pop('key')] = entry
+                    lines += 1
+                except (ValueError, KeyError):
+                    damaged = True
+    
+    # Rewrite damaged files too, so new lines aren't appended to a partial one
+    if legacy_path.exists() or damaged or lines > len(progress):
+        tmp_path = Path(f"{path}.tmp")
+        tmp_path.write_bytes(_progress_lines(progress.items()))
+        os.replace(tmp_path, path)
+        legacy_path.unlink(missing_ok=True)
+    
+    return progress
+
+
+def create_session() -> aiohttp.ClientSession:
+    """
+    Create the HTTP session shared by all RetroAchievements requests.
+    
+    Reusing one session keeps TCP/TLS connections alive between calls, and
+    the connector caches DNS lookups and caps concurrent connections.
+    A stalled request times out instead of holding a connection slot forever.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=RA_CONCURRENT_REQUESTS,
+        limit_per_host=RA_CONCURRENT_REQUESTS,
+        ttl_dns_cache=300
+    )
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+async def fetch_game_progression(session: aiohttp.ClientSession, api_key: str, game_id: int,
+                                 admission: AdmissionController = None) -> dict:
     """
     Fetch progression/timing data for a specific game from RetroAchievements.
     
     Returns median times in hours for beat and mastery.
     Times from RA are in seconds, we convert to hours.
+    If an admission controller is given, it is told when RA throttles us.
     """
     result = {
         'ra_beat_time': None,
@@ -128,12 +529,18 @@ async def fetch_game_progression(session: aiohttp.ClientSession, api_key: str, g
         url = f"{RA_API_BASE}/API_GetGameProgression.php"
         params = {'y': api_key, 'i': game_id}
         
+        await _ra_limiter.acquire()
         async with session.get(url, params=params) as resp:
             if resp.status != 200:
+                if admission and (resp.status == 429 or resp.status >= 500):
+                    await admission.backoff()
                 return result
             
             data = await resp.json()
         
+        if admission:
+            await admission.record_success()
+        
         # Convert seconds to hours (round to 1 decimal)
         if data.get('MedianTimeToBeat') and data['MedianTimeToBeat'] > 0:
             result['ra_beat_time'] = round(data['MedianTimeToBeat'] / 3600, 1)
@@ -155,6 +562,23 @@ async def fetch_game_progression(session: aiohttp.ClientSession, api_key: str, g
     return result
 
 
+async def prefetch_game_progression(session: aiohttp.ClientSession, api_key: str, ra_ids: list) -> dict:
+    """
+    Fetch RA progression data for many games up front.
+    
+    RA answers much faster than HLTB, so all lookups run ahead of the HLTB
+    pass at their own (higher) concurrency, keeping RA off the critical path.
+    Returns {ra_id: progression result}.
+    """
+    admission = AdmissionController(RA_CONCURRENT_REQUESTS)
+    
+    async def fetch_one(game_id):
+        async with admission:
+            return game_id, await fetch_game_progression(session, api_key, game_id, admission)
+    
+    return dict(await asyncio.gather(*(fetch_one(game_id) for game_id in ra_ids)))
+
+
 class CredentialManager:
     """Manages RetroAchievements credentials with secure storage."""
     
@@ -214,6 +638,10 @@ class CredentialDialog:
     """GUI dialog for entering RetroAchievements credentials."""
     
     def __init__(self, existing_username: str = ""):
+        # tkinter is only needed when prompting, so keep it off the startup path
+        import tkinter as tk
+        from tkinter import ttk
+        
         self.result = None
         self.root = tk.Tk()
         self.root.title("RetroAchievements Login")
@@ -350,6 +778,8 @@ class CredentialDialog:
         webbrowser.open(url)
     
     def _submit(self):
+        from tkinter import messagebox
+        
         username = self.username_entry.get().strip()
         api_key = self.apikey_entry.get().strip()
         
@@ -413,13 +843,27 @@ def get_credentials(reset: bool = False) -> tuple[str, str]:
     return (username, api_key)
 
 
-async def fetch_want_to_play_list(username: str, api_key: str, use_cache: bool = True) -> list:
-    """Fetch the user's Want to Play list from RetroAchievements API."""
+async def fetch_want_to_play_list(session: aiohttp.ClientSession, username: str, api_key: str,
+                                  use_cache: bool = True, max_age: float = None) -> list:
+    """
+    Fetch the user's Want to Play list from RetroAchievements API.
+    
+    With use_cache, a cached list for the same user is returned instead;
+    max_age (seconds) additionally limits that to a recently fetched one.
+    """
     cache_path = Path(RA_CACHE_FILE)
+    meta_path = Path(RA_CACHE_META_FILE)
     
     if use_cache and cache_path.exists():
-        with open(cache_path, 'r') as f:
-            cached = json.load(f)
+        # Check the tiny sidecar first so another user's list is never parsed.
+        # Caches written before the sidecar existed fall through to the full file.
+        meta = read_json(meta_path) if meta_path.exists() else None
+        if max_age is not None:
+            # Without a recorded fetch time the age is unknown: treat as stale
+            fetched = (meta or {}).get('fetched', 0)
+            use_cache = time.time() - fetched < max_age
+        if use_cache and (meta is None or meta.get('username', '').lower() == username.lower()):
+            cached = read_json(cache_path)
             if cached.get('username', '').lower() == username.lower():
                 print(f"Using cached Want to Play list ({len(cached['games'])} games)")
                 print("  (Use --refresh to re-fetch from RetroAchievements)")
@@ -427,108 +871,263 @@ async def fetch_want_to_play_list(username: str, api_key: str, use_cache: bool =
     
     print(f"Fetching Want to Play list for '{username}' from RetroAchievements...")
     
-    all_games = []
-    offset = 0
     page_size = 500
     
-    async with aiohttp.ClientSession() as session:
-        while True:
-            url = f"{RA_API_BASE}/API_GetUserWantToPlayList.php"
-            params = {'y': api_key, 'u': username, 'c': page_size, 'o': offset}
-            
-            async with session.get(url, params=params) as resp:
-                if resp.status == 401:
-                    print("Error: Invalid API key or unauthorized")
-                    print("Use --reset-creds to re-enter your credentials")
-                    sys.exit(1)
-                elif resp.status != 200:
-                    print(f"Error: API returned status {resp.status}")
-                    sys.exit(1)
-                
-                data = await resp.json()
-            
-            results = data.get('Results', [])
-            total = data.get('Total', 0)
-            
-            if not results:
-                break
+    async def fetch_page(offset: int) -> dict:
+        url = f"{RA_API_BASE}/API_GetUserWantToPlayList.php"
+        params = {'y': api_key, 'u': username, 'c': page_size, 'o': offset}
+        
+        await _ra_limiter.acquire()
+        async with session.get(url, params=params) as resp:
+            if resp.status == 401:
+                print("Error: Invalid API key or unauthorized")
+                print("Use --reset-creds to re-enter your credentials")
+                sys.exit(1)
+            elif resp.status != 200:
+                print(f"Error: API returned status {resp.status}")
+                sys.exit(1)
             
+            return await resp.json()
+    
+    # The first page tells us the total, the rest can be fetched together
+    data = await fetch_page(0)
+    all_games = data.get('Results', [])
+    total = data.get('Total', 0)
+    
+    if all_games:
+        print(f"  Fetched {len(all_games)}/{total} games...")
+        admission = AdmissionController(RA_PAGE_CONCURRENCY)
+        fetched = len(all_games)
+        
+        async def fetch_rest(offset: int) -> list:
+            nonlocal fetched
+            async with admission:
+                results = (await fetch_page(offset)).get('Results', [])
+            if results:
+                fetched += len(results)
+                print(f"  Fetched {fetched}/{total} games...")
+            return results
+        
+        offsets = range(page_size, total, page_size)
+        # gather keeps the pages in list order
+        for results in await asyncio.gather(*(fetch_rest(offset) for offset in offsets)):
             all_games.extend(results)
-            print(f"  Fetched {len(all_games)}/{total} games...")
-            
-            offset += page_size
-            if offset >= total:
-                break
     
     print(f"  Total: {len(all_games)} games in Want to Play list")
     
-    with open(cache_path, 'w') as f:
-        json.dump({'username': username, 'games': all_games}, f)
+    write_json(cache_path, {'username': username, 'games': all_games})
+    write_json(meta_path, {'username': username, 'count': len(all_games), 'fetched': time.time()})
     
     return all_games
 
 
 def convert_ra_to_dataframe(ra_games: list) -> pd.DataFrame:
     """Convert RetroAchievements game list to DataFrame."""
-    rows = []
-    for game in ra_games:
-        rows.append({
-            'Title': game['Title'],
-            'System': game['ConsoleName'],
-            'Achievements': game.get('AchievementsPublished', 0),
-            'Points': game.get('PointsTotal', 0),
-            'RA_ID': game['ID'],
-            # HLTB times
-            'HLTB_Beat': None,
-            'HLTB_Complete': None,
-            # RA actual times (from player data)
-            'RA_Beat': None,
-            'RA_Master': None,
-            'RA_Players': None,
-            # Efficiency
-            'Points_Per_Hour': None,
-            'Comments': None
-        })
-    return pd.DataFrame(rows)
-
-
-def calculate_efficiency(df: pd.DataFrame) -> pd.DataFrame:
+    # Build each column straight from the game list (no per-row alignment)
+    df = pd.DataFrame({
+        col: [game.get(field) for game in ra_games] for field, col in RA_GAME_FIELDS.items()
+    })
+    # Counts are never missing and fit easily in 32 bits (half the memory of int64)
+    df[['Achievements', 'Points']] = df[['Achievements', 'Points']].fillna(0).astype('int32')
+    
+    # HLTB times, RA actual times (from player data) and efficiency are
+    # filled in later; add them as empty columns in one go. Numbers get
+    # float columns so results are written into typed blocks, not objects.
+    # These stay float64: float32 would write 43.1 hours as 43.0999984741211
+    df = df.assign(**{col: None if col == 'Comments' else float('nan') for col in EMPTY_DATA_COLUMNS})
+    
+    # Each added column is its own block; copying merges the six float
+    # columns into one 2D block, which the later column updates keep intact
+    return df.copy()
+
+
+def as_numeric(values: pd.Series) -> pd.Series:
+    """Coerce a column to numbers (bad values become NaN), skipping columns that already are."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values
+    return pd.to_numeric(values, errors='coerce')
+
+
+def efficiency_time(df: pd.DataFrame) -> pd.Series:
+    """
+    Hours used for the efficiency metric: the first positive time out of
+    RA_Master, HLTB_Complete and HLTB_Beat (NaN if none).
+    """
+    time_val = None
+    for col in ('RA_Master', 'HLTB_Complete', 'HLTB_Beat'):
+        times = as_numeric(df[col])
+        times = times.where(times > 0)
+        time_val = times if time_val is None else time_val.combine_first(times)
+    return time_val
+
+
+def calculate_efficiency(df: pd.DataFrame, rows=None) -> pd.DataFrame:
     """
     Calculate efficiency metrics for prioritizing games.
     
     Points_Per_Hour = Points / RA_Master time (or HLTB_Complete as fallback)
     Higher = more "rewarding" games (more points for less time)
+    Pass rows (index labels) to only recalculate games that just changed.
     """
-    for idx, row in df.iterrows():
-        # Prefer RA mastery time (actual data), fallback to HLTB
-        time_val = row.get('RA_Master') or row.get('HLTB_Complete') or row.get('HLTB_Beat')
-        points = row.get('Points', 0)
-        
-        if time_val and time_val > 0 and points and points > 0:
-            df.at[idx, 'Points_Per_Hour'] = round(points / time_val, 1)
+    target = df if rows is None else df.loc[rows]
+    
+    # Prefer RA mastery time (actual data), fallback to HLTB
+    time_val = efficiency_time(target)
+    points = as_numeric(target['Points'])
+    
+    mask = time_val.notna() & (points > 0)
+    df.loc[mask.index[mask], 'Points_Per_Hour'] = (points[mask] / time_val[mask]).round(1)
     
     return df
 
 
-async def search_game(game_title: str, system: str = None) -> dict:
-    """Search for a game on HowLongToBeat with improved matching."""
-    result = {
-        'beat': None, 'complete': None, 'hltb_name': None,
-        'similarity': 0.0, 'error': None, 'comment': None
-    }
+def apply_results(df: pd.DataFrame, results: dict, overwrite_comments: bool = False):
+    """
+    Write results into the DataFrame in a single aligned update.
     
-    # Aggressive title normalization for better HLTB matching
-    clean_title = normalize_title(game_title)
+    results maps row index -> progress entry (see PROGRESS_COLUMNS).
+    None values are skipped, so existing data is never blanked out; with
+    overwrite_comments, Comments is replaced even by None (an exact match),
+    so a fresh lookup clears the note left by an earlier one.
+    """
+    # Build only the tracked columns, one list each, rather than inferring a
+    # frame from every key of every entry and then discarding most of them
+    entries = results.values()
+    updates = pd.DataFrame(
+        {col: [entry.get(key) for entry in entries] for key, col in PROGRESS_COLUMNS.items()},
+        index=list(results)
+    )
+    # Comments reads back from Excel as float when empty; make room for text
+    if df['Comments'].dtype != object:
+        df['Comments'] = df['Comments'].astype(object)
+    df.update(updates)
+    if overwrite_comments:
+        df.loc[updates.index, 'Comments'] = updates['Comments']
+
+
+def write_excel(df: pd.DataFrame, excel_path: Path):
+    """Write results to Excel with the fastest writer installed (pyexcelerate, xlsxwriter, openpyxl)."""
+    if XLSXWRITER_AVAILABLE and not PYEXCELERATE_AVAILABLE:
+        # (Its constant_memory mode can't be used: pandas writes column by column)
+        df.to_excel(excel_path, index=False, engine='xlsxwriter')
+        return
     
-    # Build list of search variants to try
-    search_variants = []
+    # Plain rows with NaN as empty cells
+    rows = df.astype(object).where(df.notna(), None).values.tolist()
     
-    # Handle pipe-separated alternate titles (e.g., "Game A | Game B")
-    if ' | ' in clean_title:
-        parts = [p.strip() for p in clean_title.split(' | ')]
-        search_variants.extend(parts)
+    if PYEXCELERATE_AVAILABLE:
+        # Hand the whole sheet over as one block of rows
+        workbook = Workbook()
+        workbook.new_sheet('Sheet1', data=[df.columns.tolist()] + rows)
+        workbook.save(str(excel_path))
+        return
+    
+    # openpyxl's write-only mode streams rows out instead of building a Cell
+    # object per value (imported here so startup doesn't pay for it)
+    import openpyxl
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet('Sheet1')
+    sheet.append(df.columns.tolist())
+    for row in rows:
+        sheet.append(row)
+    workbook.save(excel_path)
+
+
+def checkpoint_path(excel_path: Path) -> Path:
+    """Path of the Parquet checkpoint kept next to the Excel output during a scan."""
+    return excel_path.with_suffix('.ckpt.parquet')
+
+
+def parquet_path(excel_path: Path) -> Path:
+    """Path of the Parquet copy of the finished results, read back by the menu tools."""
+    return excel_path.with_suffix('.parquet')
+
+
+def write_parquet(df: pd.DataFrame, path: Path) -> bool:
+    """Write df as Parquet if pyarrow is available. Returns False if nothing was written."""
+    if not PARQUET_AVAILABLE:
+        return False
+    try:
+        df.to_parquet(path, index=False)
+        return True
+    except Exception:
+        return False  # Mixed column types Parquet can't store
+
+
+def save_checkpoint(df: pd.DataFrame, excel_path: Path):
+    """
+    Save in-progress results between batches.
+    
+    Writes a Parquet checkpoint when pyarrow is available, which is far
+    cheaper than re-serializing the whole workbook every batch; otherwise
+    (or if the frame can't be stored as Parquet) rewrites the Excel file.
+    """
+    if not write_parquet(df, checkpoint_path(excel_path)):
+        write_excel(df, excel_path)
+
+
+def save_results(df: pd.DataFrame, excel_path: Path):
+    """Write the finished results to Excel, plus a Parquet copy for fast reloading."""
+    write_excel(df, excel_path)
+    # Written after the xlsx so it is the newer file unless the sheet is edited by hand
+    if not write_parquet(df, parquet_path(excel_path)):
+        parquet_path(excel_path).unlink(missing_ok=True)
+    checkpoint_path(excel_path).unlink(missing_ok=True)
+
+
+def load_results(excel_path: Path) -> pd.DataFrame:
+    """
+    Load saved results from whichever is newest: the Excel file, its Parquet
+    copy, or the checkpoint of an interrupted scan.
+    
+    Parquet skips the XML parsing of the workbook and keeps column types.
+    """
+    candidates = [excel_path]
+    if PARQUET_AVAILABLE:
+        candidates += [parquet_path(excel_path), checkpoint_path(excel_path)]
+    existing = [path for path in candidates if path.exists()]
+    newest = max(existing, key=lambda path: path.stat().st_mtime, default=excel_path)
+    
+    if newest.suffix == '.parquet':
+        df = pd.read_parquet(newest)
     else:
-        search_variants.append(clean_title)
+        with warnings.catch_warnings():
+            # pyexcelerate writes no stylesheet; openpyxl warns but reads the data fine
+            warnings.filterwarnings('ignore', message='Workbook contains no stylesheet')
+            df = pd.read_excel(newest)
+    
+    # Earlier versions saved the normalized titles; they are recomputed on each scan
+    df = df.drop(columns='Norm_Title', errors='ignore')
+    
+    # Few distinct systems: category codes make per-system counts and filters cheap
+    df['System'] = df['System'].astype('category')
+    return df
+
+
+def build_search_variants(clean_title: str) -> list:
+    """
+    Build the list of HLTB search terms for a normalized title, in priority order.
+    
+    A single scan over the title locates the alternate-title separators and
+    the subtitle separator; the variants are then sliced out of the title.
+    """
+    pipes = []
+    colon = dash = -1
+    for match in _VARIANT_SEP_RE.finditer(clean_title):
+        pos = match.start()
+        if match.lastgroup == 'alt':
+            if not pipes or pos >= pipes[-1] + 3:
+                pipes.append(pos)
+        elif match.lastgroup == 'colon':
+            if colon < 0:
+                colon = pos
+        elif dash < 0:
+            dash = pos
+    
+    # Handle pipe-separated alternate titles (e.g., "Game A | Game B")
+    starts = [0] + [pos + 3 for pos in pipes]
+    ends = pipes + [len(clean_title)]
+    search_variants = [clean_title[start:end].strip() for start, end in zip(starts, ends)]
     
     # Add variant without "Version" suffix (Pokemon FireRed Version -> Pokemon FireRed)
     for variant in search_variants.copy():
@@ -536,12 +1135,90 @@ async def search_game(game_title: str, system: str = None) -> dict:
             search_variants.append(variant[:-8])
     
     # Add base title (before colon/dash) as lower priority fallback
-    for sep in [':', ' - ']:
-        if sep in clean_title:
-            base = clean_title.split(sep)[0].strip()
-            if base not in search_variants:
-                search_variants.append(base)
-            break
+    cut = colon if colon >= 0 else dash
+    if cut >= 0:
+        base = clean_title[:cut].strip()
+        if base not in search_variants:
+            search_variants.append(base)
+    
+    return search_variants
+
+
+def pick_best_match(search_term: str, results: list) -> tuple:
+    """
+    Pick the best HLTB result for one search variant.
+    
+    Returns (score, game), or (-999, None) if nothing qualifies. Exact name
+    matches score 1000, containment in either direction 500+, anything
+    else its similarity percentage, minus penalties for unrequested sequels.
+    """
+    search_lower = search_term.lower().strip()
+    search_has_number = _SEQUEL_RE.search(search_term) is not None
+    names = [game.game_name.lower().strip() for game in results]
+    
+    # Nothing beats an exact name match, so skip scoring entirely
+    if search_lower in names:
+        return 1000, results[names.index(search_lower)]
+    
+    if RAPIDFUZZ_AVAILABLE:
+        # Score all candidates in one call, with WRatio standing in for
+        # HLTB's similarity; ranking below is shared with the plain path.
+        # No score cutoff: weak matches must still come back as "Poor match"
+        similarities = [0.0] * len(names)
+        for _, ratio, i in process.extract(search_lower, names, scorer=fuzz.WRatio,
+                                           processor=None, limit=None):
+            similarities[i] = ratio / 100
+    else:
+        similarities = [game.similarity for game in results]
+    
+    search_words = frozenset(search_lower.split())
+    best_match = None
+    best_score = -999
+    
+    for game, game_name_lower, similarity in zip(results, names, similarities):
+        score = 0
+        
+        # Check if search term is contained in game name or vice versa
+        if search_lower in game_name_lower or game_name_lower in search_lower:
+            score = 500 + (similarity * 100)
+        else:
+            score = similarity * 100
+        
+        # Penalty for numbered sequels when we didn't ask for one
+        # e.g., searching "Aladdin" shouldn't match "Aladdin III"
+        if not search_has_number and _SEQUEL_RE.search(game.game_name) is not None:
+            score -= 300
+        
+        # Penalty for results with extra significant words
+        significant_extra = set(game_name_lower.split()) - search_words - _COMMON_WORDS
+        score -= len(significant_extra) * 15
+        
+        if score > best_score:
+            best_score = score
+            best_match = game
+    
+    return best_score, best_match
+
+
+async def search_game(game_title: str, system: str = None, clean_title: str = None) -> dict:
+    """
+    Search for a game on HowLongToBeat with improved matching.
+    
+    Pass clean_title when the normalized title is already known
+    (e.g. normalized with the whole list) to skip normalizing it again.
+    """
+    result = {
+        'beat': None, 'complete': None, 'hltb_name': None,
+        'similarity': 0.0, 'error': None, 'comment': None
+    }
+    
+    # Aggressive title normalization for better HLTB matching
+    if clean_title is None:
+        clean_title = normalize_title(game_title)
+    
+    # Build list of search variants to try
+    search_variants = build_search_variants(clean_title)
+    variant_keys = {v.lower().strip() for v in search_variants}
     
     # Map RA system names to HLTB-friendly search terms
     system_map = {
@@ -566,45 +1243,23 @@ async def search_game(game_title: str, system: str = None) -> dict:
         best_match = None
         best_score = -999
         
+        searched = set()
         for search_term in search_variants:
+            # Identical variants (e.g. "Game | Game") would return the same results
+            if search_term in searched:
+                continue
+            searched.add(search_term)
+            
+            await _hltb_limiter.acquire()
             results = await hltb.async_search(search_term, search_modifiers=SearchModifiers.HIDE_DLC)
             
             if not results:
                 continue
             
-            for game in results:
-                score = 0
-                game_name_lower = game.game_name.lower().strip()
-                search_lower = search_term.lower().strip()
-                
-                # Exact match is best
-                if game_name_lower == search_lower:
-                    score = 1000
-                # Check if search term is contained in game name or vice versa
-                elif search_lower in game_name_lower or game_name_lower in search_lower:
-                    score = 500 + (game.similarity * 100)
-                else:
-                    score = game.similarity * 100
-                
-                # Penalty for numbered sequels when we didn't ask for one
-                # e.g., searching "Aladdin" shouldn't match "Aladdin III"
-                search_has_number = bool(re.search(r'\b(II|III|IV|V|VI|VII|VIII|IX|X|\d+)\b', search_term, re.IGNORECASE))
-                result_has_number = bool(re.search(r'\b(II|III|IV|V|VI|VII|VIII|IX|X|\d+)\b', game.game_name, re.IGNORECASE))
-                
-                if result_has_number and not search_has_number:
-                    score -= 300
-                
-                # Penalty for results with extra significant words
-                search_words = set(search_lower.split())
-                result_words = set(game_name_lower.split())
-                extra_words = result_words - search_words
-                common_words = {'the', 'a', 'an', 'of', 'and', '&', '-', 'edition', 'remastered', 'hd', 'definitive'}
-                significant_extra = extra_words - common_words
-                score -= len(significant_extra) * 15
-                
-                if score > best_score:
-                    best_score = score
-                    best_match = game
+            score, game = pick_best_match(search_term, results)
+            if game is not None and score > best_score:
+                best_score = score
+                best_match = game
         
         if not best_match:
             result['error'] = 'No results'
@@ -628,7 +1283,7 @@ async def search_game(game_title: str, system: str = None) -> dict:
         match_lower = best_match.game_name.lower().strip()
         
         # Check all variants for exact match
-        is_exact = any(v.lower().strip() == match_lower for v in search_variants)
+        is_exact = match_lower in variant_keys
         
         if is_exact:
             result['comment'] = None
@@ -646,253 +1301,341 @@ async def search_game(game_title: str, system: str = None) -> dict:
     return result
 
 
+def hltb_lookup_failed(result: dict) -> bool:
+    """True if an HLTB lookup failed (timeout, network error) rather than finishing."""
+    # 'No results' is a finished search that HLTB simply had no match for
+    return result.get('error') not in (None, 'No results')
+
+
+def hltb_status(result: dict) -> str:
+    """
+    Outcome of the HLTB lookup in a search result or progress entry:
+    'ok', 'missing' (HLTB has no match) or 'error' (the lookup failed).
+    """
+    if 'hltb_status' in result:
+        return result['hltb_status']
+    # Entries written before hltb_status existed only have the search error
+    if hltb_lookup_failed(result):
+        return 'error'
+    return 'missing' if result.get('error') == 'No results' else 'ok'
+
+
+async def cached_search_game(game_title: str, system: str, clean_title: str, hltb_cache: dict,
+                             admission: AdmissionController) -> dict:
+    """
+    search_game, but at most one HLTB lookup per normalized title.
+    
+    HLTB matching only depends on the normalized title, so games sharing
+    one (re-releases, regional variants, the same game on two systems) reuse
+    a single result. hltb_cache maps clean_title to a finished result or to
+    the in-flight lookup task that concurrent callers wait on. Failed
+    lookups are not shared: they leave the cache, and games that were
+    waiting on one search for themselves.
+    
+    Only actual searches take an admission slot, so games waiting on
+    another game's lookup don't crowd out the ones that need HLTB. A
+    failed search (timeout, connection error) lowers the HLTB limit like
+    an RA 429/5xx does; finished searches raise it again.
+    """
+    async def admitted_search():
+        async with admission:
+            result = await search_game(game_title, system, clean_title)
+            if hltb_lookup_failed(result):
+                await admission.backoff()
+            else:
+                await admission.record_success()
+            return result
+    
+    lookup = hltb_cache.get(clean_title)
+    if isinstance(lookup, dict):
+        return lookup
+    
+    if lookup is not None:
+        result = await lookup
+        if not hltb_lookup_failed(result):
+            return result
+        return await admitted_search()
+    
+    lookup = hltb_cache[clean_title] = asyncio.ensure_future(admitted_search())
+    result = await lookup
+    if hltb_lookup_failed(result) and hltb_cache.get(clean_title) is lookup:
+        del hltb_cache[clean_title]
+    return result
+
+
 async def process_single_game(
     idx: int, 
-    row: pd.Series, 
+    row: dict, 
     total: int,
-    session: aiohttp.ClientSession, 
-    api_key: str,
-    semaphore: asyncio.Semaphore,
-    progress: dict,
-    progress_path: Path
+    progression: dict,
+    hltb_cache: dict,
+    admission: AdmissionController,
+    writer: ProgressWriter,
+    console: ConsoleWriter
 ) -> dict:
-    """Process a single game with semaphore-controlled concurrency."""
+    """Process a single game; its HLTB search (if any) is admission-controlled."""
     title = row['Title']
+    clean_title = row['Norm_Title']
     system = row.get('System', '')
     ra_id = row.get('RA_ID')
     cache_key = f"{title}|{system}"
     
-    async with semaphore:
-        # Small delay to be polite
-        await asyncio.sleep(DELAY_BETWEEN_REQUESTS)
+    # Fetch HLTB data (shared by games with the same normalized title)
+    hltb_result = await cached_search_game(title, system, clean_title, hltb_cache, admission)
+    
+    # RA progression data was prefetched for the whole run
+    ra_result = progression.get(ra_id, {})
+    
+    # Merge results and queue them for the progress file, recording the
+    # HLTB outcome: later runs skip games HLTB doesn't know and retry
+    # lookups that failed
+    combined = {**hltb_result, **ra_result, 'hltb_status': hltb_status(hltb_result)}
+    writer.put(cache_key, combined)
+    
+    # Print result
+    if hltb_result['hltb_name'] or ra_result.get('ra_master_time'):
+        parts = []
+        if hltb_result['beat']:
+            parts.append(f"HLTB: {hltb_result['beat']}h")
+        if ra_result.get('ra_master_time'):
+            parts.append(f"RA Master: {ra_result['ra_master_time']}h")
         
-        print(f"[{idx + 1}/{total}] {title} ({system})...", end=" ", flush=True)
+        match_name = hltb_result.get('hltb_name', 'N/A')
+        times_str = f"[{', '.join(parts)}]" if parts else '[No times]'
         
-        # Fetch HLTB data
-        hltb_result = await search_game(title, system)
-        
-        # Fetch RA progression data
-        ra_result = {}
-        if ra_id:
-            ra_result = await fetch_game_progression(session, api_key, ra_id)
-        
-        # Merge results
-        combined = {**hltb_result, **ra_result}
-        
-        # Print result
-        if hltb_result['hltb_name'] or ra_result.get('ra_master_time'):
-            parts = []
-            if hltb_result['beat']:
-                parts.append(f"HLTB: {hltb_result['beat']}h")
-            if ra_result.get('ra_master_time'):
-                parts.append(f"RA Master: {ra_result['ra_master_time']}h")
-            
-            match_name = hltb_result.get('hltb_name', 'N/A')
-            times_str = f"[{', '.join(parts)}]" if parts else '[No times]'
-            
-            # Color based on match quality
-            if hltb_result['hltb_name'] and hltb_result['similarity'] < 0.6:
-                print(f"→ {Colors.ORANGE}{match_name}{Colors.RESET} {times_str}")
-            else:
-                print(f"→ {match_name} {times_str}")
+        # Color based on match quality
+        if hltb_result['hltb_name'] and hltb_result['similarity'] < 0.6:
+            outcome = f"→ {Colors.ORANGE}{match_name}{Colors.RESET} {times_str}"
         else:
-            print(f"{Colors.RED}✗ {hltb_result['error'] or 'No data'}{Colors.RESET}")
-        
-        return {
-            'idx': idx,
-            'cache_key': cache_key,
-            'hltb_result': hltb_result,
-            'ra_result': ra_result,
-            'combined': combined
-        }
+            outcome = f"→ {match_name} {times_str}"
+    else:
+        outcome = f"{Colors.RED}✗ {hltb_result['error'] or 'No data'}{Colors.RESET}"
+    console.put(f"[{idx + 1}/{total}] {title} ({system})... {outcome}")
+    
+    return {
+        'idx': idx,
+        'cache_key': cache_key,
+        'hltb_result': hltb_result,
+        'ra_result': ra_result,
+        'combined': combined
+    }
 
 
-async def process_games(df: pd.DataFrame, excel_path: Path, api_key: str):
-    """Process all games with concurrent HLTB lookups and RA progression data."""
-    progress = {}
+async def process_games(session: aiohttp.ClientSession, df: pd.DataFrame, excel_path: Path, api_key: str,
+                        retry_missing: bool = False):
+    """
+    Process all games with concurrent HLTB lookups and RA progression data.
+    
+    Games already in the progress file are not looked up again, including
+    those HLTB had no match for, unless retry_missing is set. Games whose
+    lookup failed (timeouts, network errors) are always tried again.
+    """
     progress_path = Path(PROGRESS_FILE)
-    if progress_path.exists():
-        with open(progress_path, 'r') as f:
-            progress = json.load(f)
+    progress = load_progress(progress_path)
+    if progress:
         print(f"Resuming from progress file ({len(progress)} games cached)")
     
+    retry = {'error', 'missing'} if retry_missing else {'error'}
+    retries = [key for key, entry in progress.items() if hltb_status(entry) in retry]
+    for key in retries:
+        del progress[key]
+    if retries or retry_missing:
+        reason = "failed or found no match" if retry_missing else "failed"
+        print(f"Retrying {len(retries)} games whose HLTB lookup {reason}")
+    
     total = len(df)
-    skipped = 0
-    from_cache = 0
-    
-    # First pass: apply cached results
-    for idx, row in df.iterrows():
-        title = row['Title']
-        system = row.get('System', '')
-        cache_key = f"{title}|{system}"
-        
-        # Skip if already has all data in dataframe
-        if (pd.notna(row.get('HLTB_Beat')) and pd.notna(row.get('HLTB_Complete')) and
-            pd.notna(row.get('RA_Master'))):
-            skipped += 1
-            continue
-        
-        # Apply from progress cache
-        if cache_key in progress:
-            cached = progress[cache_key]
-            if cached.get('beat') is not None:
-                df.at[idx, 'HLTB_Beat'] = cached['beat']
-            if cached.get('complete') is not None:
-                df.at[idx, 'HLTB_Complete'] = cached['complete']
-            if cached.get('ra_beat_time') is not None:
-                df.at[idx, 'RA_Beat'] = cached['ra_beat_time']
-            if cached.get('ra_master_time') is not None:
-                df.at[idx, 'RA_Master'] = cached['ra_master_time']
-            if cached.get('distinct_players') is not None:
-                df.at[idx, 'RA_Players'] = cached['distinct_players']
-            if cached.get('comment') is not None:
-                df.at[idx, 'Comments'] = cached['comment']
-            from_cache += 1
-    
-    # Build list of games that need processing
-    games_to_process = []
-    for idx, row in df.iterrows():
-        title = row['Title']
-        system = row.get('System', '')
-        cache_key = f"{title}|{system}"
-        
-        if cache_key not in progress and not (
-            pd.notna(row.get('HLTB_Beat')) and pd.notna(row.get('HLTB_Complete')) and
-            pd.notna(row.get('RA_Master'))):
-            games_to_process.append((idx, row))
+    
+    # Normalize every title once up front for the HLTB searches. Done on
+    # each scan (and not saved) so a matching update applies to all rows
+    norm_titles = normalize_titles(df['Title'])
+    
+    # Cache keys and completeness for every row, computed column-wise.
+    # Keys use the raw title: subsets, hacks and regional versions normalize
+    # to the same title but are separate RA games with their own RA data
+    # (the normalized title is only shared for HLTB results, see hltb_cache)
+    cache_keys = df['Title'].astype(str) + '|' + df['System'].astype(str)
+    progress_keys = list(progress)
+    has_data = df['HLTB_Beat'].notna() & df['HLTB_Complete'].notna() & df['RA_Master'].notna()
+    in_progress = cache_keys.isin(progress_keys)
+    
+    # Skip rows that already have all data in dataframe
+    skipped = int(has_data.sum())
+    
+    # First pass: apply cached results from progress cache in one update
+    cached = ~has_data & in_progress
+    from_cache = int(cached.sum())
+    if from_cache:
+        apply_results(df, {idx: progress[key] for idx, key in cache_keys[cached].items()})
+    
+    # Efficiency for everything known so far; fetched games are added as they arrive
+    calculate_efficiency(df)
+    
+    # Build list of games that need processing, as plain dicts rather than
+    # one Series per row. Games needing the most HLTB searches (alternate
+    # titles, subtitles) go first, so the slow ones don't straggle at the end
+    pending = ~has_data & ~in_progress
+    to_process = df.loc[pending, ['Title', 'System', 'RA_ID']].assign(Norm_Title=norm_titles[pending])
+    games_to_process = list(to_process.to_dict('index').items())
+    games_to_process.sort(key=lambda game: len(build_search_variants(game[1]['Norm_Title'])), reverse=True)
     
     print(f"\nProcessing {total} games ({from_cache} from cache, {skipped} skipped, {len(games_to_process)} to fetch)...\n")
     print(f"Using {MAX_CONCURRENT_REQUESTS} concurrent requests")
     print("-" * 70)
     
     if games_to_process:
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        ra_ids = {row.get('RA_ID') for _, row in games_to_process}
+        ra_ids = [ra_id for ra_id in ra_ids if pd.notna(ra_id) and ra_id]
+        print(f"Fetching RA progression data for {len(ra_ids)} games...")
+        progression = await prefetch_game_progression(session, api_key, ra_ids)
+        
+        # HLTB results already known from earlier runs, by normalized title
+        hltb_cache = {}
+        for key, entry in progress.items():
+            if hltb_lookup_failed(entry):
+                continue  # A timeout for one game says nothing about the others
+            title_key = normalize_title(key.rsplit('|', 1)[0])
+            hltb_cache.setdefault(title_key, {field: entry.get(field) for field in HLTB_RESULT_FIELDS})
+        
+        admission = AdmissionController(MAX_CONCURRENT_REQUESTS)
+        writer = ProgressWriter(progress, progress_path)
+        writer.start()
+        console = ConsoleWriter()
+        console.start()
         
-        async with aiohttp.ClientSession() as session:
-            # Process in batches to allow periodic saves
-            batch_size = 25
-            for batch_start in range(0, len(games_to_process), batch_size):
-                batch = games_to_process[batch_start:batch_start + batch_size]
-                
-                tasks = [
-                    process_single_game(
-                        idx, row, total, session, api_key, 
-                        semaphore, progress, progress_path
-                    )
-                    for idx, row in batch
-                ]
-                
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            # Admission control paces the lookups; handle each as soon as it finishes
+            tasks = [
+                process_single_game(
+                    idx, row, total, progression, hltb_cache,
+                    admission, writer, console
+                )
+                for idx, row in games_to_process
+            ]
+            
+            fetched = {}
+            completed = 0
+            checkpoint_every = CHECKPOINT_EVERY if PARQUET_AVAILABLE else EXCEL_CHECKPOINT_EVERY
+            for next_result in asyncio.as_completed(tasks):
+                try:
+                    result = await next_result
+                    fetched[result['idx']] = result['combined']
+                except Exception as e:
+                    console.put(f"Error: {e}")
+                completed += 1
                 
-                # Apply results to dataframe and save progress
-                for result in results:
-                    if isinstance(result, Exception):
-                        print(f"Error: {result}")
-                        continue
-                    
-                    idx = result['idx']
-                    hltb_result = result['hltb_result']
-                    ra_result = result['ra_result']
-                    
-                    if hltb_result['beat'] is not None:
-                        df.at[idx, 'HLTB_Beat'] = hltb_result['beat']
-                    if hltb_result['complete'] is not None:
-                        df.at[idx, 'HLTB_Complete'] = hltb_result['complete']
-                    if ra_result.get('ra_beat_time') is not None:
-                        df.at[idx, 'RA_Beat'] = ra_result['ra_beat_time']
-                    if ra_result.get('ra_master_time') is not None:
-                        df.at[idx, 'RA_Master'] = ra_result['ra_master_time']
-                    if ra_result.get('distinct_players') is not None:
-                        df.at[idx, 'RA_Players'] = ra_result['distinct_players']
-                    if hltb_result['comment'] is not None:
-                        df.at[idx, 'Comments'] = hltb_result['comment']
+                # Apply results and checkpoint every few completions
+                if completed % checkpoint_every == 0 or completed == len(tasks):
+                    if fetched:
+                        apply_results(df, fetched, overwrite_comments=True)
+                        calculate_efficiency(df, list(fetched))
+                        fetched = {}
                     
-                    progress[result['cache_key']] = result['combined']
-                
-                # Save progress after each batch
-                with open(progress_path, 'w') as f:
-                    json.dump(progress, f)
-                df.to_excel(excel_path, index=False)
-                
-                if batch_start + batch_size < len(games_to_process):
-                    print(f"    [Saved progress: {batch_start + len(batch)}/{len(games_to_process)} fetched]")
-    
-    df.to_excel(excel_path, index=False)
-    
-    # Calculate efficiency metrics
-    df = calculate_efficiency(df)
-    df.to_excel(excel_path, index=False)
-    
-    # Summary
-    print("-" * 70)
-    print(f"\nComplete!")
-    print(f"  Total games: {total}")
-    print(f"  From cache: {from_cache}")
-    print(f"  Fetched: {len(games_to_process)}")
-    print(f"  Skipped (already had data): {skipped}")
-    print(f"  Games with HLTB data: {df['HLTB_Beat'].notna().sum()}")
-    print(f"  Games with RA mastery data: {df['RA_Master'].notna().sum()}")
-    
-    comments = df['Comments'].fillna('')
-    exact = (comments == '').sum() - df['HLTB_Beat'].isna().sum()
-    fuzzy = comments.str.contains('Fuzzy match', case=False).sum()
-    loose = comments.str.contains('Loose match', case=False).sum()
-    poor = comments.str.contains('Poor match', case=False).sum()
-    none = comments.str.contains('No HLTB match', case=False).sum()
-    
-    print(f"\nHLTB Match quality:")
-    print(f"  Exact matches: {exact}")
-    print(f"  Fuzzy matches: {fuzzy}")
-    print(f"  Loose matches: {loose}")
-    print(f"  Poor matches (needs review): {poor}")
-    print(f"  No match found: {none}")
-    
-    # Time comparison
-    if df['RA_Master'].notna().any() and df['HLTB_Complete'].notna().any():
-        both_have_data = df[(df['RA_Master'].notna()) & (df['HLTB_Complete'].notna())]
-        if len(both_have_data) > 0:
-            avg_ra = both_have_data['RA_Master'].mean()
-            avg_hltb = both_have_data['HLTB_Complete'].mean()
+                    # Progress file is written by the writer task; checkpoint the sheet
+                    # in a thread (on a snapshot) while the remaining lookups continue.
+                    # No checkpoint after the last one: save_results writes the sheet next
+                    if completed < len(tasks):
+                        await asyncio.to_thread(save_checkpoint, df.copy(), excel_path)
+                        console.put(f"    [Saved progress: {completed}/{len(tasks)} fetched]")
+        finally:
+            await console.close()
+            await writer.close()
+    
+    # Efficiency is already up to date; write the final sheet once
+    save_results(df, excel_path)
+    
+    # Summary, built in memory and written out in one go rather than
+    # flushing the console once per line
+    summary = io.StringIO()
+    with contextlib.redirect_stdout(summary):
+        print("-" * 70)
+        print(f"\nComplete!")
+        print(f"  Total games: {total}")
+        print(f"  From cache: {from_cache}")
+        print(f"  Fetched: {len(games_to_process)}")
+        print(f"  Skipped (already had data): {skipped}")
+        
+        # Column scans reused throughout the summary
+        ra_master = df['RA_Master']
+        ra_mask = ra_master.notna()
+        ra_count = int(ra_mask.sum())
+        hltb_beat_mask = df['HLTB_Beat'].notna()
+        hltb_complete_mask = df['HLTB_Complete'].notna()
+        df['Points_Per_Hour'] = as_numeric(df['Points_Per_Hour'])  # Numeric for nlargest
+        pph_mask = df['Points_Per_Hour'].notna()
+        
+        print(f"  Games with HLTB data: {hltb_beat_mask.sum()}")
+        print(f"  Games with RA mastery data: {ra_count}")
+        
+        comments = df['Comments'].fillna('')
+        exact = (comments == '').sum() - (~hltb_beat_mask).sum()
+        # Classify every comment in one case-insensitive scan, then count each kind
+        # (case is folded on the handful of distinct labels, not the whole column)
+        quality = comments.str.extract(_MATCH_QUALITY_RE, expand=False).value_counts()
+        quality = quality.groupby(quality.index.str.lower()).sum()
+        fuzzy = quality.get('fuzzy', 0)
+        loose = quality.get('loose', 0)
+        poor = quality.get('poor', 0)
+        none = quality.get('no hltb', 0)
+        
+        print(f"\nHLTB Match quality:")
+        print(f"  Exact matches: {exact}")
+        print(f"  Fuzzy matches: {fuzzy}")
+        print(f"  Loose matches: {loose}")
+        print(f"  Poor matches (needs review): {poor}")
+        print(f"  No match found: {none}")
+        
+        # Time comparison
+        both_mask = ra_mask & hltb_complete_mask
+        if both_mask.any():
+            # Both averages from one pass over the rows that have both times
+            avg_ra, avg_hltb = df.loc[both_mask, ['RA_Master', 'HLTB_Complete']].astype(float).mean()
             ratio = avg_ra / avg_hltb if avg_hltb > 0 else 0
-            print(f"\nRA vs HLTB Comparison ({len(both_have_data)} games with both):")
+            print(f"\nRA vs HLTB Comparison ({both_mask.sum()} games with both):")
             print(f"  Avg HLTB Completionist: {avg_hltb:.1f} hours")
             print(f"  Avg RA Mastery: {avg_ra:.1f} hours")
             print(f"  RA takes {ratio:.1f}x longer on average")
-    
-    if df['RA_Master'].notna().any():
-        print(f"\nRA Mastery Time estimates:")
-        print(f"  Total Mastery time: {df['RA_Master'].sum():.1f} hours ({df['RA_Master'].sum()/24:.1f} days)")
-        print(f"  Average Mastery: {df['RA_Master'].mean():.1f} hours")
-    
-    print(f"\nGames by system:")
-    for system, count in df.groupby('System').size().sort_values(ascending=False).head(10).items():
-        print(f"  {system}: {count}")
-    
-    # Show most efficient games (best points per hour based on RA mastery time)
-    if df['Points_Per_Hour'].notna().any():
-        print(f"\nMost Efficient Games (highest points per hour of mastery):")
-        # Ensure numeric dtype for nlargest
-        df['Points_Per_Hour'] = pd.to_numeric(df['Points_Per_Hour'], errors='coerce')
-        efficient = df[df['Points_Per_Hour'].notna()].nlargest(10, 'Points_Per_Hour')
-        for _, row in efficient.iterrows():
-            time_used = row['RA_Master'] or row['HLTB_Complete'] or row['HLTB_Beat']
-            time_src = "RA" if pd.notna(row['RA_Master']) else "HLTB"
-            print(f"  {row['Points_Per_Hour']:.1f} pts/hr - {row['Title']} ({row['Points']} pts, {time_used:.1f}h {time_src})")
-    
-    print(f"\nResults saved to: {excel_path}")
-    
-    missing = df[df['HLTB_Beat'].isna() & df['RA_Master'].isna()]['Title'].tolist()
-    if missing:
-        print(f"\nGames without any time data ({len(missing)}):")
-        for title in missing[:15]:
-            print(f"  - {title}")
-        if len(missing) > 15:
-            print(f"  ... and {len(missing) - 15} more")
+        
+        if ra_count:
+            # One pass for the total; the average follows from the count above
+            ra_total = ra_master.sum()
+            print(f"\nRA Mastery Time estimates:")
+            print(f"  Total Mastery time: {ra_total:.1f} hours ({ra_total/24:.1f} days)")
+            print(f"  Average Mastery: {ra_total / ra_count:.1f} hours")
+        
+        print(f"\nGames by system:")
+        for system, count in df['System'].value_counts().head(10).items():
+            print(f"  {system}: {count}")
+        
+        # Show most efficient games (best points per hour based on RA mastery time)
+        if pph_mask.any():
+            print(f"\nMost Efficient Games (highest points per hour of mastery):")
+            # Select the ten rows on the one column (NaN skipped), then pull
+            # only those rows instead of copying every rated game first
+            efficient = df.loc[df['Points_Per_Hour'].nlargest(10).index]
+            # Same time the metric was computed from, resolved for all ten rows at once
+            time_used = efficiency_time(efficient)
+            time_src = as_numeric(efficient['RA_Master']).gt(0).map({True: 'RA', False: 'HLTB'})
+            for pph, title, points, hours, src in zip(efficient['Points_Per_Hour'], efficient['Title'],
+                                                      efficient['Points'], time_used, time_src):
+                print(f"  {pph:.1f} pts/hr - {title} ({points} pts, {hours:.1f}h {src})")
+        
+        print(f"\nResults saved to: {excel_path}")
+        
+        # Count all of them, but only pull out the titles that get printed
+        missing_mask = ~hltb_beat_mask & ~ra_mask
+        missing = int(missing_mask.sum())
+        if missing:
+            print(f"\nGames without any time data ({missing}):")
+            for title in df.loc[missing_mask, 'Title'].head(15):
+                print(f"  - {title}")
+            if missing > 15:
+                print(f"  ... and {missing - 15} more")
+    sys.stdout.write(summary.getvalue())
     
     return df
 
 
-async def lookup_single_game(api_key: str):
+async def lookup_single_game(session: aiohttp.ClientSession, api_key: str):
     """Look up a single game by name or RA ID."""
     print("\n" + "=" * 70)
     print("Single Game Lookup")
@@ -908,31 +1651,31 @@ async def lookup_single_game(api_key: str):
         ra_id = int(query)
         print(f"\nLooking up RA ID: {ra_id}...")
         
-        async with aiohttp.ClientSession() as session:
-            # Fetch game info from RA
-            url = f"{RA_API_BASE}/API_GetGame.php"
-            params = {'y': api_key, 'i': ra_id}
-            
-            async with session.get(url, params=params) as resp:
-                if resp.status != 200:
-                    print(f"{Colors.RED}Error: Could not fetch game data{Colors.RESET}")
-                    return
-                data = await resp.json()
-            
-            if not data or not data.get('Title'):
-                print(f"{Colors.RED}Error: Game not found with ID {ra_id}{Colors.RESET}")
+        # Fetch game info from RA
+        url = f"{RA_API_BASE}/API_GetGame.php"
+        params = {'y': api_key, 'i': ra_id}
+        
+        await _ra_limiter.acquire()
+        async with session.get(url, params=params) as resp:
+            if resp.status != 200:
+                print(f"{Colors.RED}Error: Could not fetch game data{Colors.RESET}")
                 return
-            
-            title = data['Title']
-            system = data.get('ConsoleName', 'Unknown')
-            points = data.get('points_total', 0)
-            achievements = data.get('achievements_published', 0)
-            
-            print(f"\nFound: {title} ({system})")
-            print(f"  Achievements: {achievements} | Points: {points}")
-            
-            # Get RA progression data
-            ra_result = await fetch_game_progression(session, api_key, ra_id)
+            data = await resp.json()
+        
+        if not data or not data.get('Title'):
+            print(f"{Colors.RED}Error: Game not found with ID {ra_id}{Colors.RESET}")
+            return
+        
+        title = data['Title']
+        system = data.get('ConsoleName', 'Unknown')
+        points = data.get('points_total', 0)
+        achievements = data.get('achievements_published', 0)
+        
+        print(f"\nFound: {title} ({system})")
+        print(f"  Achievements: {achievements} | Points: {points}")
+        
+        # Get RA progression data
+        ra_result = await fetch_game_progression(session, api_key, ra_id)
         
         # Search HLTB
         print(f"  Searching HLTB...")
@@ -987,20 +1730,32 @@ def show_backlog_summary(output_path: Path):
         input("\nPress Enter to continue...")
         return
     
-    df = pd.read_excel(output_path)
+    df = load_results(output_path)
+    
+    if df.empty:
+        print("\nNo games in the saved results.")
+        input("\nPress Enter to continue...")
+        return
     
     # Ensure numeric columns
     for col in ['RA_Master', 'HLTB_Complete', 'HLTB_Beat', 'Points', 'Points_Per_Hour']:
         if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+            df[col] = as_numeric(df[col])
+    
+    # Masks reused throughout the summary
+    ra_master = df['RA_Master']
+    ra_mask = ra_master.notna()
+    ra_count = int(ra_mask.sum())
+    ra_any = ra_count > 0
+    pph_mask = df['Points_Per_Hour'].notna()
     
     print(f"\nTotal games: {len(df)}")
-    print(f"Games with RA mastery data: {df['RA_Master'].notna().sum()}")
+    print(f"Games with RA mastery data: {ra_count}")
     print(f"Games with HLTB data: {df['HLTB_Beat'].notna().sum()}")
     
-    if df['RA_Master'].notna().any():
-        total_hours = df['RA_Master'].sum()
-        avg_hours = df['RA_Master'].mean()
+    if ra_any:
+        total_hours = ra_master.sum()
+        avg_hours = total_hours / ra_count
         print(f"\nRA Mastery Time:")
         print(f"  Total: {total_hours:,.1f} hours ({total_hours/24:,.1f} days)")
         print(f"  Average: {avg_hours:.1f} hours per game")
@@ -1009,28 +1764,29 @@ def show_backlog_summary(output_path: Path):
         total_points = df['Points'].sum()
         print(f"\nTotal Points Available: {total_points:,}")
     
-    # Games by system
+    # Games by system (mastery hours summed once for every system)
     print(f"\nGames by System:")
-    for system, count in df.groupby('System').size().sort_values(ascending=False).head(10).items():
-        system_hours = df[df['System'] == system]['RA_Master'].sum()
+    hours_by_system = df.groupby('System', sort=False, observed=True)['RA_Master'].sum()
+    for system, count in df['System'].value_counts().head(10).items():
+        system_hours = hours_by_system[system]
         if pd.notna(system_hours) and system_hours > 0:
             print(f"  {system}: {count} games ({system_hours:.1f}h)")
         else:
             print(f"  {system}: {count} games")
     
     # Top 5 longest games
-    if df['RA_Master'].notna().any():
+    if ra_any:
         print(f"\nTop 5 Longest Games (by RA Mastery):")
-        longest = df[df['RA_Master'].notna()].nlargest(5, 'RA_Master')
-        for _, row in longest.iterrows():
-            print(f"  {row['RA_Master']:.1f}h - {row['Title']}")
+        longest = df.loc[df['RA_Master'].nlargest(5).index, ['RA_Master', 'Title']]
+        for row in longest.itertuples(index=False):
+            print(f"  {row.RA_Master:.1f}h - {row.Title}")
     
     # Top 5 most efficient
-    if df['Points_Per_Hour'].notna().any():
+    if pph_mask.any():
         print(f"\nTop 5 Most Efficient (points per hour):")
-        efficient = df[df['Points_Per_Hour'].notna()].nlargest(5, 'Points_Per_Hour')
-        for _, row in efficient.iterrows():
-            print(f"  {row['Points_Per_Hour']:.1f} pts/hr - {row['Title']}")
+        efficient = df.loc[df['Points_Per_Hour'].nlargest(5).index, ['Points_Per_Hour', 'Title']]
+        for row in efficient.itertuples(index=False):
+            print(f"  {row.Points_Per_Hour:.1f} pts/hr - {row.Title}")
     
     input("\nPress Enter to continue...")
 
@@ -1047,8 +1803,8 @@ def estimate_completion_time(output_path: Path):
         input("\nPress Enter to continue...")
         return
     
-    df = pd.read_excel(output_path)
-    df['RA_Master'] = pd.to_numeric(df['RA_Master'], errors='coerce')
+    df = load_results(output_path)
+    df['RA_Master'] = as_numeric(df['RA_Master'])
     
     total_hours = df['RA_Master'].sum()
     
@@ -1093,23 +1849,32 @@ def estimate_completion_time(output_path: Path):
     input("\nPress Enter to continue...")
 
 
-async def run_scan(username: str, api_key: str, output_path: Path, fresh: bool = False, 
-                   systems_filter: list = None, systems_exclude: list = None):
+async def run_scan(session: aiohttp.ClientSession, username: str, api_key: str, output_path: Path,
+                   fresh: bool = False, systems_filter: list = None, systems_exclude: list = None,
+                   retry_missing: bool = False):
     """Run a scan (update or fresh)."""
     print("\n" + "=" * 70)
     print("RetroAchievements + HowLongToBeat Scraper")
     print("=" * 70)
     
-    if not fresh and output_path.exists():
+    if not fresh and (output_path.exists() or checkpoint_path(output_path).exists()):
         print(f"\nFound existing {output_path}")
         print("Loading and checking for new games...")
-        df = pd.read_excel(output_path)
-        
-        ra_games = await fetch_want_to_play_list(username, api_key, use_cache=False)
-        ra_df = convert_ra_to_dataframe(ra_games)
-        
-        existing_ids = set(df['RA_ID'].dropna().astype(int)) if 'RA_ID' in df.columns else set()
-        new_games = ra_df[~ra_df['RA_ID'].isin(existing_ids)]
+        # Parse the saved results in a thread while the RA list downloads.
+        # A list fetched moments ago (e.g. back-to-back runs) is reused as is
+        df, ra_games = await asyncio.gather(
+            asyncio.to_thread(load_results, output_path),
+            fetch_want_to_play_list(session, username, api_key, max_age=RA_CACHE_TTL)
+        )
+        
+        # Numeric array of known IDs so isin takes the hash-table fast path
+        if 'RA_ID' in df.columns:
+            existing_ids = df['RA_ID'].dropna().astype('int64').unique()
+        else:
+            existing_ids = []
+        # Only the games not in the results yet are converted
+        is_new = ~pd.Index([game.get('ID') for game in ra_games]).isin(existing_ids)
+        new_games = convert_ra_to_dataframe([game for game, new in zip(ra_games, is_new) if new])
         
         if len(new_games) > 0:
             print(f"Found {len(new_games)} new games to add!")
@@ -1117,7 +1882,7 @@ async def run_scan(username: str, api_key: str, output_path: Path, fresh: bool =
         else:
             print("No new games found in Want to Play list")
     else:
-        ra_games = await fetch_want_to_play_list(username, api_key, use_cache=False)
+        ra_games = await fetch_want_to_play_list(session, username, api_key, use_cache=False)
         
         if not ra_games:
             print("No games found in Want to Play list!")
@@ -1126,6 +1891,9 @@ async def run_scan(username: str, api_key: str, output_path: Path, fresh: bool =
         
         df = convert_ra_to_dataframe(ra_games)
     
+    # Category, as in load_results (new games are plain strings)
+    df['System'] = df['System'].astype('category')
+    
     # Apply system filters
     if systems_filter:
         df = df[df['System'].isin(systems_filter)]
@@ -1135,11 +1903,14 @@ async def run_scan(username: str, api_key: str, output_path: Path, fresh: bool =
         df = df[~df['System'].isin(systems_exclude)]
         print(f"Excluded systems: {', '.join(systems_exclude)} ({len(df)} games remaining)")
     
+    # Filtered-out systems must not show up with zero games in the summary
+    df['System'] = df['System'].cat.remove_unused_categories()
+    
     if len(df) == 0:
         print("No games to process after filtering!")
         return
     
-    await process_games(df, output_path, api_key)
+    await process_games(session, df, output_path, api_key, retry_missing)
 
 
 def get_system_selection(df_or_path, mode='filter'):
@@ -1147,7 +1918,7 @@ def get_system_selection(df_or_path, mode='filter'):
     if isinstance(df_or_path, Path):
         if not df_or_path.exists():
             return None
-        df = pd.read_excel(df_or_path)
+        df = load_results(df_or_path)
     else:
         df = df_or_path
     
@@ -1186,7 +1957,7 @@ def export_to_csv(output_path: Path):
         return
     
     csv_path = output_path.with_suffix('.csv')
-    df = pd.read_excel(output_path)
+    df = load_results(output_path)
     df.to_csv(csv_path, index=False)
     print(f"\n{Colors.GREEN}Exported to: {csv_path}{Colors.RESET}")
     input("\nPress Enter to continue...")
@@ -1223,7 +1994,7 @@ def print_menu(username: str = None):
     print("=" * 70)
 
 
-async def interactive_menu(output_path: Path):
+async def interactive_menu(session: aiohttp.ClientSession, output_path: Path):
     """Run the interactive menu."""
     username = None
     api_key = None
@@ -1246,7 +2017,7 @@ async def interactive_menu(output_path: Path):
             # Update scan
             if not username:
                 username, api_key = get_credentials()
-            await run_scan(username, api_key, output_path, fresh=False)
+            await run_scan(session, username, api_key, output_path, fresh=False)
         
         elif choice == '2':
             # Fresh scan
@@ -1256,10 +2027,13 @@ async def interactive_menu(output_path: Path):
             # Warn about what will be deleted/overwritten
             files_to_clear = []
             progress_path = Path(PROGRESS_FILE)
+            legacy_progress_path = Path(LEGACY_PROGRESS_FILE)
             ra_cache_path = Path(RA_CACHE_FILE)
             
             if progress_path.exists():
                 files_to_clear.append(f"  - {PROGRESS_FILE} (HLTB lookup cache)")
+            if legacy_progress_path.exists():
+                files_to_clear.append(f"  - {LEGACY_PROGRESS_FILE} (old HLTB lookup cache)")
             if ra_cache_path.exists():
                 files_to_clear.append(f"  - {RA_CACHE_FILE} (RA game list cache)")
             if output_path.exists():
@@ -1277,11 +2051,15 @@ async def interactive_menu(output_path: Path):
                 # Clear the cache files
                 if progress_path.exists():
                     progress_path.unlink()
+                legacy_progress_path.unlink(missing_ok=True)
                 if ra_cache_path.exists():
                     ra_cache_path.unlink()
+                Path(RA_CACHE_META_FILE).unlink(missing_ok=True)
+                checkpoint_path(output_path).unlink(missing_ok=True)
+                parquet_path(output_path).unlink(missing_ok=True)
                 print("Cache files cleared.")
             
-            await run_scan(username, api_key, output_path, fresh=True)
+            await run_scan(session, username, api_key, output_path, fresh=True)
         
         elif choice == '3':
             # Scan specific systems
@@ -1289,30 +2067,30 @@ async def interactive_menu(output_path: Path):
                 username, api_key = get_credentials()
             
             # Need to fetch game list first to show systems
-            ra_games = await fetch_want_to_play_list(username, api_key, use_cache=True)
+            ra_games = await fetch_want_to_play_list(session, username, api_key, use_cache=True)
             temp_df = convert_ra_to_dataframe(ra_games)
             
             systems = get_system_selection(temp_df, mode='filter')
             if systems:
-                await run_scan(username, api_key, output_path, fresh=False, systems_filter=systems)
+                await run_scan(session, username, api_key, output_path, fresh=False, systems_filter=systems)
         
         elif choice == '4':
             # Scan excluding systems
             if not username:
                 username, api_key = get_credentials()
             
-            ra_games = await fetch_want_to_play_list(username, api_key, use_cache=True)
+            ra_games = await fetch_want_to_play_list(session, username, api_key, use_cache=True)
             temp_df = convert_ra_to_dataframe(ra_games)
             
             systems = get_system_selection(temp_df, mode='exclude')
             if systems:
-                await run_scan(username, api_key, output_path, fresh=False, systems_exclude=systems)
+                await run_scan(session, username, api_key, output_path, fresh=False, systems_exclude=systems)
         
         elif choice == '5':
             # Single game lookup
             if not username:
                 username, api_key = get_credentials()
-            await lookup_single_game(api_key)
+            await lookup_single_game(session, api_key)
         
         elif choice == '6':
             # Backlog summary
@@ -1352,13 +2130,16 @@ async def main_async(args):
     """Main async entry point."""
     output_path = Path(args.output)
     
-    if args.menu or (not args.refresh and not args.reset_creds and not hasattr(args, 'run_direct')):
-        # Interactive menu mode
-        await interactive_menu(output_path)
-    else:
-        # Direct execution mode (legacy CLI)
-        username, api_key = get_credentials(reset=args.reset_creds)
-        await run_scan(username, api_key, output_path, fresh=args.refresh)
+    async with create_session() as session:
+        if args.menu or (not args.refresh and not args.reset_creds and not args.retry_missing
+                         and not hasattr(args, 'run_direct')):
+            # Interactive menu mode
+            await interactive_menu(session, output_path)
+        else:
+            # Direct execution mode (legacy CLI)
+            username, api_key = get_credentials(reset=args.reset_creds)
+            await run_scan(session, username, api_key, output_path, fresh=args.refresh,
+                           retry_missing=args.retry_missing)
 
 
 def main():
@@ -1371,6 +2152,8 @@ def main():
                         help='Re-fetch Want to Play list from RetroAchievements')
     parser.add_argument('--reset-creds', action='store_true',
                         help='Clear stored credentials and prompt again')
+    parser.add_argument('--retry-missing', action='store_true',
+                        help='Search HLTB again for games that had no match')
     parser.add_argument('--menu', action='store_true',
                         help='Show interactive menu (default behavior)')
     parser.add_argument('--no-menu', action='store_true',